@@ -8,13 +8,30 @@ is in memory at a time (suitable for very large exports).
 import argparse
 import hashlib
 import json
+import os
 import re
 from pathlib import Path
 from typing import Optional
 
 import ijson
 
-from .db import DB_PATH_DEFAULT, get_connection, init_schema, insert_entry
+from .db import (
+    DB_PATH_DEFAULT,
+    BulkLoadRefusedError,
+    bulk_load,
+    commit_batch,
+    get_connection,
+    get_import_progress,
+    init_schema,
+    insert_entry,
+    save_import_progress,
+)
+
+# Conversations imported per transaction; each commit also stores a checkpoint.
+CHECKPOINT_EVERY = 100
+
+# Bytes hashed from each end of the source file for its checkpoint identity.
+FINGERPRINT_SAMPLE_BYTES = 8 * 1024 * 1024
 
 
 def normalize_created_at(iso_str: str) -> Optional[str]:
@@ -99,26 +116,121 @@ def content_hash(conversation_uuid: str, human_message_uuid: str, answer_plain:
     return hasher.hexdigest()
 
 
+def source_fingerprint(path: Path) -> str:
+    """Cheap identity of a source file for import checkpoints.
+
+    Hashes the size, mtime and the first and last ``FINGERPRINT_SAMPLE_BYTES``
+    instead of the whole file, so normal imports do not read a multi-GB
+    export twice.
+    """
+    stat = os.stat(path)
+    hasher = hashlib.sha256()
+    hasher.update(f"{stat.st_size}|{stat.st_mtime_ns}|".encode("utf-8"))
+    with open(path, "rb") as f:
+        hasher.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+        if stat.st_size > FINGERPRINT_SAMPLE_BYTES:
+            tail_start = stat.st_size - FINGERPRINT_SAMPLE_BYTES
+            f.seek(max(FINGERPRINT_SAMPLE_BYTES, tail_start))
+            hasher.update(f.read())
+    return hasher.hexdigest()
+
+
 def parse_claude_json(
     path: Path,
     conn,
     *,
     limit: Optional[int] = None,
+    bulk: bool = False,
+    resume: bool = False,
 ) -> int:
     """
     Stream the JSON array at path with ijson; for each conversation, extract
     Q&A pairs and insert into entries. Returns number of inserted rows.
+
+    Every ``CHECKPOINT_EVERY`` conversations the rows are committed together
+    with a checkpoint in ``import_progress``. With ``resume=True``
+    conversations up to the last checkpoint for the same file are skipped
+    on the parser event stream, without being built, normalized, hashed or
+    inserted.
+
+    With ``bulk=True`` the import runs in bulk-load mode (see
+    :func:`parsers.db.bulk_load`); a resumed import may re-enter it even
+    though the database is no longer empty.
     """
     path = Path(path)
+    source_digest = source_fingerprint(path)
+    progress = get_import_progress(conn, source_digest) if resume else None
+    if progress is not None and progress["completed"]:
+        return 0
+    if progress is not None:
+        print(
+            f"Resuming after conversation {progress['conversation_index'] + 1} "
+            f"(~{progress['byte_offset'] // (1024 * 1024)} MB into the file)"
+        )
+
+    if bulk:
+        with bulk_load(conn, allow_existing=progress is not None):
+            return _import_claude_json(path, conn, source_digest, progress, limit=limit)
+    return _import_claude_json(path, conn, source_digest, progress, limit=limit)
+
+
+def _import_claude_json(
+    path: Path,
+    conn,
+    source_digest: str,
+    progress,
+    *,
+    limit: Optional[int],
+) -> int:
     source_file = str(path)
     inserted = 0
 
+    start_index = 0
+    last_uuid = ""
+    if progress is not None:
+        start_index = progress["conversation_index"] + 1
+        last_uuid = progress["conversation_uuid"] or ""
+
+    def checkpoint(index: int, uuid: str, offset: int, completed: bool = False) -> None:
+        save_import_progress(
+            conn,
+            source_digest=source_digest,
+            agent="claude",
+            source_file=source_file,
+            conversation_index=index,
+            conversation_uuid=uuid,
+            byte_offset=offset,
+            completed=completed,
+        )
+        commit_batch(conn)
+
+    last_index = start_index - 1
     with open(path, "rb") as f:
-        for conversation in ijson.items(f, "item"):
+        if start_index:
+            # Count finished top-level conversations on the raw event stream,
+            # then let ijson build objects only from the next one onwards.
+            events = ijson.parse(f)
+            skipped = 0
+            for prefix, event, _ in events:
+                if prefix == "item" and event == "end_map":
+                    skipped += 1
+                    if skipped == start_index:
+                        break
+            conversations = ijson.items(events, "item")
+        else:
+            conversations = ijson.items(f, "item")
+
+        for index, conversation in enumerate(conversations, start_index):
             conv_uuid = conversation.get("uuid") or ""
             chat_messages = conversation.get("chat_messages") or []
             for pair in extract_qa_pairs(chat_messages):
                 if limit is not None and inserted >= limit:
+                    # Rows of this partially imported conversation are kept;
+                    # a resumed run re-reads it and skips them via content_hash.
+                    if last_index >= 0:
+                        checkpoint(last_index, last_uuid, f.tell())
+                    else:
+                        commit_batch(conn)
                     return inserted
                 answer_plain = pair["answer_plain"]
                 answer_html = answer_plain  # Claude export is plain/markdown; store same for both
@@ -134,9 +246,16 @@ def parse_claude_json(
                     answer_html=answer_html,
                     attachments_raw=pair["attachments_raw"],
                     content_hash=ch,
+                    commit=False,
                 )
                 if new_id:
                     inserted += 1
+            last_index, last_uuid = index, conv_uuid
+            # f.tell() is the reader position, which ijson buffers ahead of
+            # the conversation end; it is used for progress reporting only.
+            if (index + 1) % CHECKPOINT_EVERY == 0:
+                checkpoint(index, conv_uuid, f.tell())
+        checkpoint(last_index, last_uuid, f.tell(), completed=True)
     return inserted
 
 
@@ -163,6 +282,23 @@ def main() -> None:
         default=0,
         help="Maximum number of entries to import (<=0 = no limit).",
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help=(
+            "Bulk-load mode for a first import into an empty database: defer "
+            "FTS and index maintenance until the end."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Continue an interrupted import of the same file from its last "
+            "checkpoint instead of re-processing every conversation. Can be "
+            "combined with --bulk to finish an interrupted bulk import."
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -175,7 +311,12 @@ def main() -> None:
 
     limit = args.limit if args.limit and args.limit > 0 else None
 
-    inserted = parse_claude_json(input_path, conn, limit=limit)
+    try:
+        inserted = parse_claude_json(
+            input_path, conn, limit=limit, bulk=args.bulk, resume=args.resume
+        )
+    except BulkLoadRefusedError as exc:
+        raise SystemExit(str(exc)) from exc
     print(f"Inserted {inserted} Claude entries into {args.db}")
 
 
@@ -1,12 +1,75 @@
 import os
 import sqlite3
+import sys
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from .normalize import normalize_for_match
 
 DB_PATH_DEFAULT = Path("db") / "ai.sqlite"
 
+# Bulk-load mode is only allowed when the table holds at most this many rows;
+# beyond that, rebuilding the whole FTS index costs more than it saves.
+BULK_LOAD_MAX_EXISTING_ROWS = 1000
+
+# Rows inserted between commits while in bulk-load mode.
+BULK_LOAD_COMMIT_EVERY = 1000
+
+FTS_TRIGGERS_SQL = """
+    CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries
+    BEGIN
+        INSERT INTO entries_fts(rowid, question_norm, answer_plain_norm)
+        VALUES (new.id, new.question_norm, new.answer_plain_norm);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries
+    BEGIN
+        DELETE FROM entries_fts WHERE rowid = old.id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS entries_au AFTER UPDATE ON entries
+    BEGIN
+        UPDATE entries_fts
+        SET question_norm = new.question_norm,
+            answer_plain_norm = new.answer_plain_norm
+        WHERE rowid = new.id;
+    END;
+"""
+
+# Bump the data generation on any change to ``entries`` so query caches (see
+# ui/lib/queryCache.ts) can tell their pages are stale.
+GENERATION_TRIGGERS_SQL = """
+    CREATE TRIGGER IF NOT EXISTS entries_gen_ai AFTER INSERT ON entries
+    BEGIN
+        UPDATE data_generation SET value = value + 1 WHERE id = 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS entries_gen_ad AFTER DELETE ON entries
+    BEGIN
+        UPDATE data_generation SET value = value + 1 WHERE id = 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS entries_gen_au AFTER UPDATE ON entries
+    BEGIN
+        UPDATE data_generation SET value = value + 1 WHERE id = 1;
+    END;
+"""
+
+BUMP_GENERATION_SQL = "UPDATE data_generation SET value = value + 1 WHERE id = 1;"
+
+SECONDARY_INDEXES_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_entries_created_at
+        ON entries(created_at);
+
+    CREATE INDEX IF NOT EXISTS idx_entries_agent
+        ON entries(agent);
+"""
+
+
+class BulkLoadRefusedError(Exception):
+    """Raised when bulk-load mode is requested for a database that has data."""
+
 
 def get_connection(db_path: Optional[os.PathLike] = None) -> sqlite3.Connection:
     """Return a SQLite connection and ensure the ``db/`` directory exists."""
@@ -25,7 +88,11 @@ def get_connection(db_path: Optional[os.PathLike] = None) -> sqlite3.Connection:
 def init_schema(conn: sqlite3.Connection) -> None:
     """Create the ``entries`` table and FTS5 ``entries_fts`` table including triggers.
 
-    This function is idempotent (uses IF NOT EXISTS).
+    This function is idempotent (uses IF NOT EXISTS). The FTS index is
+    rebuilt from ``entries`` and all triggers and indexes are recreated on
+    every call, which is also what repairs a bulk load that was interrupted
+    before :func:`end_bulk_load` ran; the ``bulk_load_state`` marker is used
+    to detect and report that case.
     """
     cursor = conn.cursor()
 
@@ -49,13 +116,43 @@ def init_schema(conn: sqlite3.Connection) -> None:
             answer_plain_norm TEXT
         );
 
-        CREATE INDEX IF NOT EXISTS idx_entries_created_at
-            ON entries(created_at);
+        -- A row here means a bulk load is (or was, if it crashed) running
+        -- with FTS triggers and secondary indexes dropped.
+        CREATE TABLE IF NOT EXISTS bulk_load_state (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            started_at TEXT DEFAULT (datetime('now'))
+        );
+
+        -- Single-row counter bumped by triggers whenever entries change.
+        CREATE TABLE IF NOT EXISTS data_generation (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            value INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO data_generation (id, value) VALUES (1, 0);
 
-        CREATE INDEX IF NOT EXISTS idx_entries_agent
-            ON entries(agent);
+        -- Last fully imported position in a streamed source file, keyed by
+        -- the file's digest so a resumed run only trusts the same file.
+        CREATE TABLE IF NOT EXISTS import_progress (
+            source_digest TEXT PRIMARY KEY,
+            agent TEXT NOT NULL,
+            source_file TEXT NOT NULL,
+            conversation_index INTEGER NOT NULL,
+            conversation_uuid TEXT,
+            byte_offset INTEGER NOT NULL,
+            completed INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT DEFAULT (datetime('now'))
+        );
         """
     )
+    interrupted_bulk_load = is_bulk_load_pending(conn)
+    if interrupted_bulk_load:
+        print(
+            "Detected an interrupted bulk load; rebuilding indexes and "
+            "full-text search.",
+            file=sys.stderr,
+        )
+    cursor.executescript(SECONDARY_INDEXES_SQL)
+    cursor.executescript(GENERATION_TRIGGERS_SQL)
 
     cursor.execute("PRAGMA table_info(entries)")
     columns = {row[1] for row in cursor.fetchall()}
@@ -103,40 +200,198 @@ def init_schema(conn: sqlite3.Connection) -> None:
             content='entries',
             content_rowid='id'
         );
-
-        CREATE TRIGGER entries_ai AFTER INSERT ON entries
-        BEGIN
-            INSERT INTO entries_fts(rowid, question_norm, answer_plain_norm)
-            VALUES (new.id, new.question_norm, new.answer_plain_norm);
-        END;
-
-        CREATE TRIGGER entries_ad AFTER DELETE ON entries
-        BEGIN
-            DELETE FROM entries_fts WHERE rowid = old.id;
-        END;
-
-        CREATE TRIGGER entries_au AFTER UPDATE ON entries
-        BEGIN
-            UPDATE entries_fts
-            SET question_norm = new.question_norm,
-                answer_plain_norm = new.answer_plain_norm
-            WHERE rowid = new.id;
-        END;
         """
     )
+    cursor.executescript(FTS_TRIGGERS_SQL)
     cursor.execute("INSERT INTO entries_fts(entries_fts) VALUES('rebuild')")
+    # Everything a bulk load drops has just been recreated and rebuilt, so an
+    # interrupted bulk load (if any) is repaired at this point.
+    # The FTS rebuild changes no rows and backfilled rows already bumped the
+    # generation through entries_gen_au; only rows a bulk load inserted
+    # without generation triggers still need to be announced.
+    if interrupted_bulk_load:
+        cursor.execute("DELETE FROM bulk_load_state")
+        cursor.execute(BUMP_GENERATION_SQL)
+    conn.commit()
+
+
+def is_bulk_load_pending(conn: sqlite3.Connection) -> bool:
+    """Return True if a bulk load has started and not yet finished."""
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1 FROM bulk_load_state WHERE id = 1")
+    return cursor.fetchone() is not None
+
+
+def commit_batch(conn: sqlite3.Connection) -> None:
+    """Commit a batch of inserts made with ``insert_entry(..., commit=False)``.
+
+    In bulk-load mode the generation triggers are dropped, so the data
+    generation is bumped here, in the same transaction as the batch, to keep
+    query caches from serving pages that predate the committed rows.
+    """
+    if is_bulk_load_pending(conn):
+        conn.execute(BUMP_GENERATION_SQL)
+    conn.commit()
+
+
+def begin_bulk_load(conn: sqlite3.Connection, *, allow_existing: bool = False) -> None:
+    """Enter bulk-load mode: drop FTS/generation triggers and non-unique indexes.
+
+    Only allowed on an empty or near-empty database (see
+    ``BULK_LOAD_MAX_EXISTING_ROWS``) unless ``allow_existing`` is set, which
+    resumed imports use to finish an interrupted first import. The unique
+    ``content_hash`` index is kept so ``INSERT OR IGNORE`` de-duplication
+    works as in a normal import.
+    The marker row and the drops are committed in one transaction, so a crash
+    at any later point is detected and repaired by :func:`init_schema`.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM entries")
+    existing = cursor.fetchone()[0]
+    if not allow_existing and existing > BULK_LOAD_MAX_EXISTING_ROWS:
+        raise BulkLoadRefusedError(
+            f"Bulk load requires an empty or near-empty database "
+            f"(found {existing} entries, limit {BULK_LOAD_MAX_EXISTING_ROWS})."
+        )
+    conn.commit()
+    cursor.executescript(
+        """
+        BEGIN;
+        INSERT OR REPLACE INTO bulk_load_state (id) VALUES (1);
+        DROP TRIGGER IF EXISTS entries_ai;
+        DROP TRIGGER IF EXISTS entries_ad;
+        DROP TRIGGER IF EXISTS entries_au;
+        DROP TRIGGER IF EXISTS entries_gen_ai;
+        DROP TRIGGER IF EXISTS entries_gen_ad;
+        DROP TRIGGER IF EXISTS entries_gen_au;
+        DROP INDEX IF EXISTS idx_entries_created_at;
+        DROP INDEX IF EXISTS idx_entries_agent;
+        COMMIT;
+        """
+    )
+
+
+def end_bulk_load(conn: sqlite3.Connection) -> None:
+    """Leave bulk-load mode: rebuild ``entries_fts`` once and recreate indexes.
+
+    Pending inserts are committed first. Rebuilding from the ``entries``
+    content table yields the same index a row-by-row import would have built.
+    The data generation is bumped once for the whole load.
+    """
     conn.commit()
+    cursor = conn.cursor()
+    cursor.executescript(
+        "BEGIN;"
+        + SECONDARY_INDEXES_SQL
+        + FTS_TRIGGERS_SQL
+        + GENERATION_TRIGGERS_SQL
+        + BUMP_GENERATION_SQL
+        + """
+        INSERT INTO entries_fts(entries_fts) VALUES('rebuild');
+        DELETE FROM bulk_load_state;
+        COMMIT;
+        """
+    )
+
+
+@contextmanager
+def bulk_load(
+    conn: sqlite3.Connection, *, allow_existing: bool = False
+) -> Iterator[None]:
+    """Context manager wrapping :func:`begin_bulk_load` / :func:`end_bulk_load`.
+
+    The load is finalized when the body completes or is interrupted with
+    Ctrl+C (rows inserted so far are kept, as in a normal import). On any
+    other error the pending rows are committed with a generation bump if the
+    connection still allows it, the original error propagates and the marker
+    is left in place, so the next :func:`init_schema` repairs the database.
+    """
+    begin_bulk_load(conn, allow_existing=allow_existing)
+    try:
+        yield
+    except KeyboardInterrupt:
+        end_bulk_load(conn)
+        raise
+    except Exception:
+        with suppress(sqlite3.Error):
+            commit_batch(conn)
+        raise
+    end_bulk_load(conn)
 
 
 def reset_agent(conn: sqlite3.Connection, agent: str) -> int:
-    """Delete all records for the given agent and return the number of deleted rows."""
+    """Delete all records for the given agent and return the number of deleted rows.
+
+    Import checkpoints for the agent are dropped too, so a later ``--resume``
+    run does not skip conversations whose rows no longer exist.
+    """
     cursor = conn.cursor()
     cursor.execute("DELETE FROM entries WHERE agent = ?", (agent,))
     deleted = cursor.rowcount
+    # Databases created by the UI or before checkpoints existed have no table.
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'import_progress'"
+    )
+    if cursor.fetchone() is not None:
+        cursor.execute("DELETE FROM import_progress WHERE agent = ?", (agent,))
     conn.commit()
     return deleted
 
 
+def get_import_progress(
+    conn: sqlite3.Connection, source_digest: str
+) -> Optional[sqlite3.Row]:
+    """Return the checkpoint row for a source file digest, or None."""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT * FROM import_progress WHERE source_digest = ?", (source_digest,)
+    )
+    return cursor.fetchone()
+
+
+def save_import_progress(
+    conn: sqlite3.Connection,
+    *,
+    source_digest: str,
+    agent: str,
+    source_file: str,
+    conversation_index: int,
+    conversation_uuid: Optional[str],
+    byte_offset: int,
+    completed: bool = False,
+) -> None:
+    """Record the last fully imported conversation for a source file.
+
+    Does not commit: callers commit the checkpoint in the same transaction as
+    the rows it covers, so the two can never disagree after a crash.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        INSERT OR REPLACE INTO import_progress (
+            source_digest,
+            agent,
+            source_file,
+            conversation_index,
+            conversation_uuid,
+            byte_offset,
+            completed,
+            updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
+        """,
+        (
+            source_digest,
+            agent,
+            source_file,
+            conversation_index,
+            conversation_uuid,
+            byte_offset,
+            int(completed),
+        ),
+    )
+
+
 def insert_entry(
     conn: sqlite3.Connection,
     *,
@@ -149,8 +404,13 @@ def insert_entry(
     answer_html: str,
     attachments_raw: Optional[str],
     content_hash: str,
+    commit: bool = True,
 ) -> int:
-    """Insert a single row into ``entries`` and return its id."""
+    """Insert a single row into ``entries`` and return its id.
+
+    Pass ``commit=False`` to batch several inserts into one transaction; the
+    caller is then responsible for calling ``conn.commit()``.
+    """
     question_norm = normalize_for_match(question)
     answer_plain_norm = normalize_for_match(answer_plain)
     cursor = conn.cursor()
@@ -185,7 +445,8 @@ def insert_entry(
             answer_plain_norm,
         ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
     # If the row was ignored due to duplicate content_hash, lastrowid stays
     # on the previous value and rowcount will be 0.
     if cursor.rowcount == 0:
@@ -8,7 +8,16 @@ from typing import Optional
 
 from bs4 import BeautifulSoup, NavigableString, Tag
 
-from .db import DB_PATH_DEFAULT, get_connection, init_schema, insert_entry
+from .db import (
+    BULK_LOAD_COMMIT_EVERY,
+    DB_PATH_DEFAULT,
+    BulkLoadRefusedError,
+    bulk_load,
+    commit_batch,
+    get_connection,
+    init_schema,
+    insert_entry,
+)
 
 
 TIMESTAMP_RE = re.compile(
@@ -123,11 +132,33 @@ def extract_answer_html(q_div: Tag, created_at_raw: str) -> str:
     return answer_html
 
 
-def parse_gemini_html(path: Path, conn, *, limit: Optional[int] = None) -> int:
+def parse_gemini_html(
+    path: Path,
+    conn,
+    *,
+    limit: Optional[int] = None,
+    bulk: bool = False,
+) -> int:
     """Parse Gemini HTML export and persist records into the database.
 
-    Returns the number of inserted records.
+    Returns the number of inserted records. With ``bulk=True`` the import runs
+    in bulk-load mode (see :func:`parsers.db.bulk_load`) and commits in batches.
     """
+    if bulk:
+        with bulk_load(conn):
+            return _import_gemini_html(
+                path, conn, limit=limit, commit_every=BULK_LOAD_COMMIT_EVERY
+            )
+    return _import_gemini_html(path, conn, limit=limit, commit_every=1)
+
+
+def _import_gemini_html(
+    path: Path,
+    conn,
+    *,
+    limit: Optional[int],
+    commit_every: int,
+) -> int:
     html_text = path.read_text(encoding="utf-8")
     soup = BeautifulSoup(html_text, "lxml")
 
@@ -231,10 +262,14 @@ def parse_gemini_html(path: Path, conn, *, limit: Optional[int] = None) -> int:
             answer_html=answer_html,
             attachments_raw=attachments_raw,
             content_hash=content_hash,
+            commit=commit_every == 1,
         )
         if new_id:
             inserted += 1
+            if commit_every > 1 and inserted % commit_every == 0:
+                commit_batch(conn)
 
+    commit_batch(conn)
     return inserted
 
 
@@ -261,6 +296,14 @@ def main() -> None:
         default=0,
         help="Maximum number of items to parse (<=0 = no limit).",
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help=(
+            "Bulk-load mode for a first import into an empty database: defer "
+            "FTS and index maintenance until the end."
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -273,7 +316,10 @@ def main() -> None:
 
     limit = args.limit if args.limit and args.limit > 0 else None
 
-    inserted = parse_gemini_html(input_path, conn, limit=limit)
+    try:
+        inserted = parse_gemini_html(input_path, conn, limit=limit, bulk=args.bulk)
+    except BulkLoadRefusedError as exc:
+        raise SystemExit(str(exc)) from exc
     print(f"Inserted {inserted} Gemini entries into {args.db}")
 
 
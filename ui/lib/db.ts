@@ -112,6 +112,60 @@ function migrateToNormFts(conn: Database.Database): void {
   conn.prepare("INSERT INTO entries_fts(entries_fts) VALUES('rebuild')").run();
 }
 
+function isBulkLoadPending(conn: Database.Database): boolean {
+  const table = conn
+    .prepare(
+      "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bulk_load_state'",
+    )
+    .get();
+  return Boolean(
+    table && conn.prepare("SELECT 1 FROM bulk_load_state WHERE id = 1").get(),
+  );
+}
+
+/**
+ * Single-row counter bumped by triggers on every change to entries (same
+ * schema as parsers/db.py). Query caches compare it to detect stale pages.
+ * While a Python bulk load is running its triggers are left alone; the
+ * importer bumps the counter per batch and recreates them when it finishes.
+ */
+function ensureDataGeneration(conn: Database.Database): void {
+  conn.exec(`
+    CREATE TABLE IF NOT EXISTS data_generation (
+      id INTEGER PRIMARY KEY CHECK (id = 1),
+      value INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO data_generation (id, value) VALUES (1, 0);
+  `);
+  if (isBulkLoadPending(conn)) return;
+
+  conn.exec(`
+    CREATE TRIGGER IF NOT EXISTS entries_gen_ai AFTER INSERT ON entries
+    BEGIN
+      UPDATE data_generation SET value = value + 1 WHERE id = 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS entries_gen_ad AFTER DELETE ON entries
+    BEGIN
+      UPDATE data_generation SET value = value + 1 WHERE id = 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS entries_gen_au AFTER UPDATE ON entries
+    BEGIN
+      UPDATE data_generation SET value = value + 1 WHERE id = 1;
+    END;
+  `);
+}
+
+export function getDataGeneration(conn: Database.Database): number {
+  const row = conn
+    .prepare<[], { value: number }>(
+      "SELECT value FROM data_generation WHERE id = 1",
+    )
+    .get();
+  return row?.value ?? 0;
+}
+
 export function getDb(): Database.Database {
   if (!db) {
     const dbPath = getDbPath();
@@ -126,6 +180,7 @@ export function getDb(): Database.Database {
     } else {
       migrateToNormFts(db);
     }
+    ensureDataGeneration(db);
   }
   return db;
 }
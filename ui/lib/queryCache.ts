@@ -0,0 +1,121 @@
+import type Database from "better-sqlite3";
+
+import { getDataGeneration } from "./db";
+
+/**
+ * In-process LRU cache for serialized query results (search and entries
+ * pages). The whole cache is dropped as soon as the data generation bumped
+ * by the entries triggers changes, so imports, deletes and agent resets
+ * never leave stale pages behind.
+ */
+
+type CacheEntry = {
+  body: string;
+  size: number;
+};
+
+type QueryCacheStats = {
+  entries: number;
+  bytes: number;
+  maxBytes: number;
+  generation: number | null;
+  hits: number;
+  misses: number;
+  evictions: number;
+  invalidations: number;
+  hitRate: number;
+  avgHitMs: number;
+  avgMissMs: number;
+};
+
+const MAX_BYTES =
+  Number(process.env.QUERY_CACHE_MAX_BYTES) || 32 * 1024 * 1024;
+
+// Map preserves insertion order; re-inserting on hit keeps LRU order.
+const cache = new Map<string, CacheEntry>();
+let cacheGeneration: number | null = null;
+let cacheBytes = 0;
+
+const counters = {
+  hits: 0,
+  misses: 0,
+  evictions: 0,
+  invalidations: 0,
+  hitMs: 0,
+  missMs: 0,
+};
+
+function clear(): void {
+  cache.clear();
+  cacheBytes = 0;
+}
+
+function evict(): void {
+  while (cacheBytes > MAX_BYTES && cache.size > 0) {
+    const oldestKey = cache.keys().next().value as string;
+    cacheBytes -= cache.get(oldestKey)!.size;
+    cache.delete(oldestKey);
+    counters.evictions += 1;
+  }
+}
+
+/**
+ * Return the JSON body for `key`, running `query` only on a cache miss.
+ *
+ * The generation is read before the query runs, so a page cached during a
+ * concurrent import is at worst newer than its generation and gets dropped
+ * on the next lookup.
+ */
+export function cachedJson(
+  db: Database.Database,
+  key: readonly unknown[],
+  query: () => unknown,
+): string {
+  const start = performance.now();
+
+  const generation = getDataGeneration(db);
+  if (generation !== cacheGeneration) {
+    if (cache.size > 0) counters.invalidations += 1;
+    clear();
+    cacheGeneration = generation;
+  }
+
+  const cacheKey = JSON.stringify(key);
+  const hit = cache.get(cacheKey);
+  if (hit) {
+    cache.delete(cacheKey);
+    cache.set(cacheKey, hit);
+    counters.hits += 1;
+    counters.hitMs += performance.now() - start;
+    return hit.body;
+  }
+
+  const body = JSON.stringify(query());
+  // JS strings are UTF-16, so two bytes per code unit is a fair estimate.
+  const size = body.length * 2;
+  if (size <= MAX_BYTES) {
+    cache.set(cacheKey, { body, size });
+    cacheBytes += size;
+    evict();
+  }
+  counters.misses += 1;
+  counters.missMs += performance.now() - start;
+  return body;
+}
+
+export function getQueryCacheStats(): QueryCacheStats {
+  const lookups = counters.hits + counters.misses;
+  return {
+    entries: cache.size,
+    bytes: cacheBytes,
+    maxBytes: MAX_BYTES,
+    generation: cacheGeneration,
+    hits: counters.hits,
+    misses: counters.misses,
+    evictions: counters.evictions,
+    invalidations: counters.invalidations,
+    hitRate: lookups ? counters.hits / lookups : 0,
+    avgHitMs: counters.hits ? counters.hitMs / counters.hits : 0,
+    avgMissMs: counters.misses ? counters.missMs / counters.misses : 0,
+  };
+}
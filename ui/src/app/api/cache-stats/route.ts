@@ -0,0 +1,6 @@
+import { NextResponse } from "next/server";
+import { getQueryCacheStats } from "@/lib/queryCache";
+
+export async function GET() {
+  return NextResponse.json(getQueryCacheStats());
+}
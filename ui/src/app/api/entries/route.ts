@@ -1,5 +1,6 @@
 import { NextResponse } from "next/server";
 import { Entry, getDb } from "@/lib/db";
+import { cachedJson } from "@/lib/queryCache";
 
 export async function GET(request: Request) {
   const { searchParams } = new URL(request.url);
@@ -18,16 +19,21 @@ export async function GET(request: Request) {
   const orderClause = `ORDER BY created_at ${order}, id ${order}`;
   const limitOffset = `LIMIT ? OFFSET ?`;
 
-  const rows = agent
-    ? db
-        .prepare<unknown[], Entry>(
-          `${baseSelect} WHERE agent = ? ${orderClause} ${limitOffset}`,
-        )
-        .all(agent, limit, offset)
-    : db
-        .prepare<unknown[], Entry>(`${baseSelect} ${orderClause} ${limitOffset}`)
-        .all(limit, offset);
+  const body = cachedJson(db, ["entries", agent, order, limit, offset], () =>
+    agent
+      ? db
+          .prepare<unknown[], Entry>(
+            `${baseSelect} WHERE agent = ? ${orderClause} ${limitOffset}`,
+          )
+          .all(agent, limit, offset)
+      : db
+          .prepare<unknown[], Entry>(
+            `${baseSelect} ${orderClause} ${limitOffset}`,
+          )
+          .all(limit, offset),
+  );
 
-  return NextResponse.json(rows);
+  return new NextResponse(body, {
+    headers: { "Content-Type": "application/json" },
+  });
 }
-
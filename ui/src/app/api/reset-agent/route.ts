@@ -12,8 +12,21 @@ export async function POST(request: Request) {
   }
 
   const db = getDb();
-  const stmt = db.prepare("DELETE FROM entries WHERE agent = ?");
-  const info = stmt.run(agent);
+  // Drop import checkpoints with the rows (as parsers/db.py reset_agent does),
+  // otherwise a resumed import would skip the deleted conversations.
+  const hasImportProgress = db
+    .prepare(
+      "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'import_progress'",
+    )
+    .get();
+  const reset = db.transaction(() => {
+    const info = db.prepare("DELETE FROM entries WHERE agent = ?").run(agent);
+    if (hasImportProgress) {
+      db.prepare("DELETE FROM import_progress WHERE agent = ?").run(agent);
+    }
+    return info;
+  });
+  const info = reset();
 
   return NextResponse.json({ deleted: info.changes ?? 0 });
 }
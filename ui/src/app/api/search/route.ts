@@ -1,6 +1,7 @@
 import { NextResponse } from "next/server";
 import { Entry, getDb } from "@/lib/db";
 import { normalizeForMatch } from "@/lib/normalize";
+import { cachedJson } from "@/lib/queryCache";
 
 export async function GET(request: Request) {
   const { searchParams } = new URL(request.url);
@@ -21,21 +22,26 @@ export async function GET(request: Request) {
     .map((t) => `${normalizeForMatch(t)}*`)
     .join(" ");
 
-  const rows = db
-    .prepare<unknown[], Entry>(
-      `
-      SELECT e.id, e.agent, e.source_file, e.question, e.created_at_raw, e.created_at,
-             e.answer_plain, e.answer_html, e.attachments_raw
-      FROM entries e
-      JOIN entries_fts f ON f.rowid = e.id
-      WHERE f.entries_fts MATCH ?
-      ${agent ? "AND e.agent = ?" : ""}
-      ORDER BY e.created_at DESC, e.id DESC
-      LIMIT ? OFFSET ?
-      `,
-    )
-    .all(...(agent ? [ftsQuery, agent, limit, offset] : [ftsQuery, limit, offset]));
+  const body = cachedJson(db, ["search", ftsQuery, agent, limit, offset], () =>
+    db
+      .prepare<unknown[], Entry>(
+        `
+        SELECT e.id, e.agent, e.source_file, e.question, e.created_at_raw, e.created_at,
+               e.answer_plain, e.answer_html, e.attachments_raw
+        FROM entries e
+        JOIN entries_fts f ON f.rowid = e.id
+        WHERE f.entries_fts MATCH ?
+        ${agent ? "AND e.agent = ?" : ""}
+        ORDER BY e.created_at DESC, e.id DESC
+        LIMIT ? OFFSET ?
+        `,
+      )
+      .all(
+        ...(agent ? [ftsQuery, agent, limit, offset] : [ftsQuery, limit, offset]),
+      ),
+  );
 
-  return NextResponse.json(rows);
+  return new NextResponse(body, {
+    headers: { "Content-Type": "application/json" },
+  });
 }
-